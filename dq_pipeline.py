@@ -6,18 +6,25 @@ Runs GE validation, Pydantic validation, and Slack notification in sequence.
 Usage:
     python dq_pipeline.py
 
-Environment Variable:
-    SLACK_WEBHOOK_URL  →  Slack Incoming Webhook address (optional)
+Environment Variables:
+    SLACK_WEBHOOK_URL        →  Slack Incoming Webhook address (optional)
+    SLACK_NOTIFY_ON_SUCCESS  →  "false" to only notify when checks fail (default: true)
 """
 
+import hashlib
+import json
+import logging
 import os
+import queue
 import sys
+import threading
+from datetime import datetime
 
 import pandas as pd
 from dotenv import load_dotenv
 
-from src.ge_validation import run_ge_validation
-from src.pydantic_validation import run_pydantic_validation
+from src.ge_validation import merge_ge_summaries, run_ge_validation
+from src.pydantic_validation import merge_pydantic_summaries, run_pydantic_validation
 from src.slack_notifier import send_slack_notification
 
 # ── Load .env file ───────────────────────────────────────────────────────────
@@ -27,32 +34,152 @@ load_dotenv() # loaded env
 
 CSV_PATH = os.path.join("data", "amazon_sales.csv")
 SLACK_WEBHOOK_URL = os.environ.get("SLACK_WEBHOOK_URL", "YOUR_SLACK_WEBHOOK_URL")
+SLACK_NOTIFY_ON_SUCCESS = os.environ.get("SLACK_NOTIFY_ON_SUCCESS", "true").lower() != "false"
+
+# Hash of the last notified results; identical results are not re-posted
+LAST_HASH_PATH = ".dq_last_hash"
+
+# Rows per chunk; bounds peak memory to one chunk of the CSV
+CHUNK_SIZE = 200_000
+# Parsed chunks allowed to wait for validation (bounds memory in the queue)
+PREFETCH_CHUNKS = 2
+
+# Only the validated columns are loaded, with explicit (narrow) dtypes.
+# Enum-like columns are plain "category" (categories inferred from the data):
+# fixing the categories to the valid sets would turn bad values into NaN and
+# hide them from both validators. Qty / Amount are left to inference (float64
+# when clean, text when a cell is malformed) so bad numbers are reported by
+# the validators instead of failing read_csv.
+_USECOLS = ["Order ID", "Date", "Status", "Fulfilment", "currency", "Qty", "Amount", "ship-country"]
+_DTYPES = {
+    "Order ID": "string",
+    "Date": "string",
+    "Status": "category",
+    "Fulfilment": "category",
+    "currency": "category",
+    "ship-country": "category",
+}
+
+
+# ── Chunk Reader ─────────────────────────────────────────────────────────────
+
+def _produce_chunks(q: queue.Queue) -> None:
+    """Parse the CSV in chunks and push them onto the queue (producer thread)."""
+    try:
+        for chunk in pd.read_csv(
+            CSV_PATH,
+            usecols=_USECOLS,
+            dtype=_DTYPES,
+            engine="c",
+            chunksize=CHUNK_SIZE,
+            low_memory=False,  # infer Qty / Amount once per chunk, not per block
+        ):
+            q.put(chunk)
+    except Exception as exc:  # re-raised in the consumer
+        q.put(exc)
+    finally:
+        q.put(None)
+
+
+def _iter_chunks():
+    """Yield CSV chunks parsed in a background thread while the caller validates."""
+    q: queue.Queue = queue.Queue(maxsize=PREFETCH_CHUNKS)
+    threading.Thread(target=_produce_chunks, args=(q,), daemon=True).start()
+
+    while (item := q.get()) is not None:
+        if isinstance(item, Exception):
+            raise item
+        yield item
+
+
+# ── Slack De-duplication ─────────────────────────────────────────────────────
+
+def _summary_hash(ge_summary: dict, pydantic_summary: dict) -> str:
+    """Content hash of both summaries, ignoring their timestamps."""
+    content = {
+        "ge": {k: v for k, v in ge_summary.items() if k != "timestamp"},
+        "pydantic": {k: v for k, v in pydantic_summary.items() if k != "timestamp"},
+    }
+    raw = json.dumps(content, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def _read_last_hash() -> str | None:
+    try:
+        with open(LAST_HASH_PATH) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _write_last_hash(digest: str) -> None:
+    with open(LAST_HASH_PATH, "w") as f:
+        f.write(digest)
 
 
 # ── Pipeline ─────────────────────────────────────────────────────────────────
 
 def main() -> None:
+    # Slack notifier reports through logging; give it its own console handler
+    # so third-party INFO logs (e.g. GX) stay out of the pipeline output.
+    # stdout (not stderr) keeps its lines in order with the prints when piped.
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("   %(levelname)s %(name)s: %(message)s"))
+    slack_logger = logging.getLogger(send_slack_notification.__module__)
+    slack_logger.addHandler(handler)
+    slack_logger.setLevel(logging.INFO)
+    slack_logger.propagate = False
+
     print("\n" + "=" * 60)
     print("   📦 DATA QUALITY PIPELINE")
     print("=" * 60)
 
-    # 1️⃣  Load data
+    # One timestamp for the whole run, shared by every chunk's summary
+    run_ts = datetime.now().isoformat()
+
+    # 1️⃣  Load data (streamed in chunks, parsed ahead in a background thread)
     print(f"\n📂 Loading data from: {CSV_PATH}")
-    df = pd.read_csv(CSV_PATH, low_memory=False)
-    print(f"   Rows: {len(df):,}  |  Columns: {len(df.columns)}")
 
-    # 2️⃣  Great Expectations Validation
-    ge_summary = run_ge_validation(df)
+    ge_summaries, pydantic_summaries = [], []
+    total_rows = 0
 
-    # 3️⃣  Pydantic Validation
-    pydantic_summary = run_pydantic_validation(df)
+    for i, chunk in enumerate(_iter_chunks(), start=1):
+        total_rows += len(chunk)
+        print(f"\n📦 Chunk {i}: {len(chunk):,} rows  |  Columns: {len(chunk.columns)}")
 
-    # 4️⃣  Slack Notification
-    send_slack_notification(ge_summary, pydantic_summary, SLACK_WEBHOOK_URL)
+        # 2️⃣  Great Expectations Validation
+        ge_summaries.append(run_ge_validation(chunk, run_ts=run_ts))
+
+        # 3️⃣  Pydantic Validation
+        pydantic_summaries.append(run_pydantic_validation(chunk, run_ts=run_ts))
+
+    print(f"\n   Rows: {total_rows:,}  |  Chunks: {len(ge_summaries)}")
+    ge_summary = merge_ge_summaries(ge_summaries)
+    pydantic_summary = merge_pydantic_summaries(pydantic_summaries)
 
-    # 5️⃣  Overall Summary
     all_ok = ge_summary["overall_success"] and pydantic_summary["overall_success"]
 
+    # 4️⃣  Slack Notification (once per run, skipped if results are unchanged)
+    digest = _summary_hash(ge_summary, pydantic_summary)
+    if digest == _read_last_hash():
+        print("\n⏭️  Slack notification skipped (results unchanged since last run)")
+    elif all_ok and not SLACK_NOTIFY_ON_SUCCESS:
+        # Nothing is sent, but the green result still replaces the stored
+        # hash, so a returning earlier failure is not taken as "unchanged"
+        print("\n✅ All checks passed; Slack notification suppressed")
+        _write_last_hash(digest)
+    else:
+        # The hash is only recorded once Slack accepted the message, so a
+        # failed delivery is retried on the next run
+        send_slack_notification(
+            ge_summary,
+            pydantic_summary,
+            SLACK_WEBHOOK_URL,
+            notify_on_success=SLACK_NOTIFY_ON_SUCCESS,
+            on_delivered=lambda: _write_last_hash(digest),
+        )
+
+    # 5️⃣  Overall Summary
     print("\n" + "=" * 60)
     print("   PIPELINE RESULT")
     print("=" * 60)
@@ -4,7 +4,7 @@ Great Expectations Validation Module
 Runs data quality validation on the Amazon Sales dataset using Great Expectations.
 
 Expectations:
-  1. Order ID → not null, unique
+  1. Order ID → not null (not unique: multi-item orders share an ID)
   2. Qty → >= 0
   3. Amount → >= 0
   4. Status → valid set
@@ -14,6 +14,8 @@ Expectations:
   8. Date → MM-DD-YY regex
 """
 
+import functools
+
 import great_expectations as gx
 import pandas as pd
 from datetime import datetime
@@ -21,7 +23,7 @@ from datetime import datetime
 
 # ── Expected Values ──────────────────────────────────────────────────────────
 
-VALID_STATUSES = [
+VALID_STATUSES: frozenset[str] = frozenset({
     "Cancelled",
     "Pending",
     "Pending - Waiting for Pick Up",
@@ -35,21 +37,28 @@ VALID_STATUSES = [
     "Shipped - Returned to Seller",
     "Shipped - Returning to Seller",
     "Shipping",
-]
+})
+
+VALID_FULFILMENT: frozenset[str] = frozenset({"Merchant", "Amazon"})
+VALID_CURRENCIES: frozenset[str] = frozenset({"INR"})
+VALID_COUNTRIES: frozenset[str] = frozenset({"IN"})
+
+SUITE_NAME = "amazon_sales_suite"
+VALIDATION_NAME = "amazon_sales_validation"
 
-VALID_FULFILMENT = ["Merchant", "Amazon"]
-VALID_CURRENCIES = ["INR"]
-VALID_COUNTRIES = ["IN"]
+# GX keeps at most this many sample values per expectation result
+_PARTIAL_LIMIT = 20
 
 
 # ── Validation ───────────────────────────────────────────────────────────────
 
-def run_ge_validation(df: pd.DataFrame) -> dict:
+def run_ge_validation(df: pd.DataFrame, run_ts: str | None = None) -> dict:
     """
     Run Great Expectations validation on the given DataFrame.
 
     Args:
         df: pandas DataFrame to validate
+        run_ts: ISO timestamp of the pipeline run (defaults to now)
 
     Returns:
         dict: {
@@ -61,16 +70,51 @@ def run_ge_validation(df: pd.DataFrame) -> dict:
     """
     print("\n🔍 Running Great Expectations Validation...")
 
+    # ── Run Validation (GX objects are built once per process) ──────────
+    validation_definition = _build_gx_objects()
+    results = validation_definition.run(batch_parameters={"dataframe": df})
+
+    # ── Process Results ──────────────────────────────────────────────────
+    return _process_results(results, run_ts or datetime.now().isoformat())
+
+
+# ── GX Setup ─────────────────────────────────────────────────────────────────
+
+@functools.cache
+def _build_gx_objects() -> gx.ValidationDefinition:
+    """Build the GX context, suite and validation definition (cached)."""
     # ── GX Context (Ephemeral – no file I/O) ─────────────────────────────
-    context = gx.get_context()
+    context = gx.get_context(mode="ephemeral")
+
+    # Reuse what the context already has registered (add-or-get)
+    try:
+        return context.validation_definitions.get(VALIDATION_NAME)
+    except gx.exceptions.DataContextError:
+        pass
 
     # Data Source → Asset → Batch
     data_source = context.data_sources.add_pandas("pandas_source")
     data_asset = data_source.add_dataframe_asset(name="amazon_sales")
     batch_definition = data_asset.add_batch_definition_whole_dataframe("full_data")
 
+    try:
+        suite = context.suites.get(SUITE_NAME)
+    except gx.exceptions.DataContextError:
+        suite = context.suites.add(_build_suite())
+
+    # ── Validation Definition ────────────────────────────────────────────
+    validation_definition = gx.ValidationDefinition(
+        name=VALIDATION_NAME,
+        data=batch_definition,
+        suite=suite,
+    )
+    return context.validation_definitions.add(validation_definition)
+
+
+def _build_suite() -> gx.ExpectationSuite:
+    """Create the (unregistered) Amazon Sales expectation suite."""
     # ── Expectation Suite ────────────────────────────────────────────────
-    suite = gx.ExpectationSuite(name="amazon_sales_suite")
+    suite = gx.ExpectationSuite(name=SUITE_NAME)
 
     # 1. Order ID: must not be null (not unique — multi-item orders share the same ID)
     suite.add_expectation(
@@ -94,28 +138,28 @@ def run_ge_validation(df: pd.DataFrame) -> dict:
     # 4. Status must be in valid set
     suite.add_expectation(
         gx.expectations.ExpectColumnValuesToBeInSet(
-            column="Status", value_set=VALID_STATUSES
+            column="Status", value_set=sorted(VALID_STATUSES)
         )
     )
 
     # 5. Fulfilment: Merchant or Amazon
     suite.add_expectation(
         gx.expectations.ExpectColumnValuesToBeInSet(
-            column="Fulfilment", value_set=VALID_FULFILMENT
+            column="Fulfilment", value_set=sorted(VALID_FULFILMENT)
         )
     )
 
     # 6. currency must be INR
     suite.add_expectation(
         gx.expectations.ExpectColumnValuesToBeInSet(
-            column="currency", value_set=VALID_CURRENCIES
+            column="currency", value_set=sorted(VALID_CURRENCIES)
         )
     )
 
     # 7. ship-country must be IN
     suite.add_expectation(
         gx.expectations.ExpectColumnValuesToBeInSet(
-            column="ship-country", value_set=VALID_COUNTRIES
+            column="ship-country", value_set=sorted(VALID_COUNTRIES)
         )
     )
 
@@ -126,40 +170,28 @@ def run_ge_validation(df: pd.DataFrame) -> dict:
         )
     )
 
-    suite = context.suites.add(suite)
-
-    # ── Run Validation ───────────────────────────────────────────────────
-    validation_definition = gx.ValidationDefinition(
-        name="amazon_sales_validation",
-        data=batch_definition,
-        suite=suite,
-    )
-    validation_definition = context.validation_definitions.add(validation_definition)
-
-    results = validation_definition.run(batch_parameters={"dataframe": df})
-
-    # ── Process Results ──────────────────────────────────────────────────
-    return _process_results(results)
+    return suite
 
 
 # ── Helper ───────────────────────────────────────────────────────────────────
 
-def _process_results(results) -> dict:
+def _process_results(results, run_ts: str) -> dict:
     """Convert raw GE results into a summary dictionary."""
     print("\n📊 Processing GE Results...")
 
-    results_dict = results.to_json_dict()
-    success = results_dict.get("success", False)
-    expectation_results = results_dict.get("results", [])
+    # Walk the result objects directly; to_json_dict() would serialize every
+    # expectation result (including sample lists) only to read a few keys.
+    success = bool(results.success)
+    expectation_results = results.results
 
     passed, failed = [], []
 
     for exp_result in expectation_results:
-        exp_config = exp_result.get("expectation_config", {})
-        exp_type = exp_config.get("type", "Unknown")
-        column = exp_config.get("kwargs", {}).get("column", "N/A")
-        success_flag = exp_result.get("success", False)
-        result_detail = exp_result.get("result", {})
+        exp_config = exp_result.expectation_config
+        exp_type = exp_config.type if exp_config else "Unknown"
+        column = exp_config.kwargs.get("column", "N/A") if exp_config else "N/A"
+        success_flag = bool(exp_result.success)
+        result_detail = exp_result.result or {}
 
         info = {
             "expectation": exp_type,
@@ -176,7 +208,7 @@ def _process_results(results) -> dict:
         "failed_count": len(failed),
         "passed": passed,
         "failed": failed,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": run_ts,
     }
 
     # Console output
@@ -210,3 +242,61 @@ def _process_results(results) -> dict:
             print(f"   ✓ {p['expectation']} (Column: {p['column']})")
 
     return summary
+
+
+# ── Chunk Merging ────────────────────────────────────────────────────────────
+
+def merge_ge_summaries(summaries: list[dict]) -> dict:
+    """
+    Combine per-chunk GE summaries into one summary for the whole dataset.
+
+    An expectation passes only if it passed on every chunk; unexpected /
+    missing counts are summed and the sample lists are concatenated.
+    """
+    if len(summaries) == 1:
+        return summaries[0]
+
+    merged: dict[tuple, dict] = {}
+    for summary in summaries:
+        for info in summary["passed"] + summary["failed"]:
+            key = (info["expectation"], info["column"])
+            if key not in merged:
+                merged[key] = {**info, "result": _merge_result({}, info["result"])}
+            else:
+                m = merged[key]
+                m["success"] = m["success"] and info["success"]
+                m["result"] = _merge_result(m["result"], info["result"])
+
+    passed = [m for m in merged.values() if m["success"]]
+    failed = [m for m in merged.values() if not m["success"]]
+
+    return {
+        "overall_success": all(s["overall_success"] for s in summaries),
+        "total_expectations": len(merged),
+        "passed_count": len(passed),
+        "failed_count": len(failed),
+        "passed": passed,
+        "failed": failed,
+        "timestamp": summaries[0]["timestamp"] if summaries else datetime.now().isoformat(),
+    }
+
+
+def _merge_result(acc: dict, r: dict) -> dict:
+    """Add one chunk's expectation result counts onto an accumulated result."""
+    element = acc.get("element_count", 0) + r.get("element_count", 0)
+    unexpected = acc.get("unexpected_count", 0) + r.get("unexpected_count", 0)
+    missing = acc.get("missing_count", 0) + r.get("missing_count", 0)
+    nonmissing = element - missing
+
+    return {
+        "element_count": element,
+        "missing_count": missing,
+        "unexpected_count": unexpected,
+        "unexpected_percent": 100 * unexpected / nonmissing if nonmissing else 0.0,
+        "partial_unexpected_list": (
+            acc.get("partial_unexpected_list", []) + r.get("partial_unexpected_list", [])
+        )[:_PARTIAL_LIMIT],
+        "partial_unexpected_index_list": (
+            acc.get("partial_unexpected_index_list", []) + r.get("partial_unexpected_index_list", [])
+        )[:_PARTIAL_LIMIT],
+    }
@@ -3,6 +3,9 @@ Pydantic Validation Module
 ===========================
 Validates each row of the Amazon Sales dataset using a Pydantic model.
 
+Each rule is first evaluated as a vectorized column mask; only the rows that
+fail at least one mask are run through the model to build error messages.
+
 Model: AmazonOrder
   - Order ID   → required (str)
   - Date       → MM-DD-YY format
@@ -15,18 +18,18 @@ Model: AmazonOrder
 
 from __future__ import annotations
 
-import math
 import re
 from datetime import datetime
 from typing import Optional
 
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, field_validator, ValidationError
+from pydantic import BaseModel, TypeAdapter, field_validator, ValidationError
 
 
 # ── Constants ────────────────────────────────────────────────────────────────
 
-VALID_STATUSES = [
+VALID_STATUSES: frozenset[str] = frozenset({
     "Cancelled",
     "Pending",
     "Pending - Waiting for Pick Up",
@@ -40,14 +43,18 @@ VALID_STATUSES = [
     "Shipped - Returned to Seller",
     "Shipped - Returning to Seller",
     "Shipping",
-]
+})
 
-VALID_FULFILMENT = ["Merchant", "Amazon"]
-VALID_CURRENCIES = ["INR"]
-VALID_COUNTRIES = ["IN"]
+VALID_FULFILMENT: frozenset[str] = frozenset({"Merchant", "Amazon"})
+VALID_CURRENCIES: frozenset[str] = frozenset({"INR"})
+VALID_COUNTRIES: frozenset[str] = frozenset({"IN"})
 
 DATE_REGEX = re.compile(r"^\d{2}-\d{2}-\d{2}$")
 
+# MM-DD-YY layout used by the vectorized date check
+_DATE_DIGIT_POS = [0, 1, 3, 4, 6, 7]
+_DATE_DASH_POS = [2, 5]
+
 
 # ── Pydantic Model ──────────────────────────────────────────────────────────
 
@@ -122,23 +129,108 @@ class AmazonOrder(BaseModel):
         return v
 
 
-# ── Helper: NaN → None ──────────────────────────────────────────────────────
+# Built once at import; validates a whole list of rows in one pydantic-core call
+_ORDERS_ADAPTER = TypeAdapter(list[AmazonOrder])
+
+
+# ── Helper: Vectorized Row Screening ────────────────────────────────────────
+
+def _text(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column as strings with missing values as "" (same as the model input)."""
+    return df[column].astype("string").fillna("")
+
+
+def _numeric(df: pd.DataFrame, column: str) -> np.ndarray:
+    """Column as a float array with missing / unparsable values as NaN."""
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
+def _bad_date_format(dates: pd.Series) -> np.ndarray:
+    """
+    Vectorized MM-DD-YY check on the code points of each string.
+
+    Strings are packed into a fixed-width "U9" array (9th slot must be empty),
+    so the check is a few comparisons per row instead of a regex match.
+    Only ASCII digits are accepted, so this is at most stricter than
+    DATE_REGEX; such rows are still judged by the model.
+    """
+    chars = dates.to_numpy(dtype="U9").view(np.uint32).reshape(-1, 9)
+    bad = ((chars[:, _DATE_DIGIT_POS] - ord("0")) >= 10).any(axis=1)
+    bad |= (chars[:, _DATE_DASH_POS] != ord("-")).any(axis=1)
+    bad |= chars[:, 8] != 0
+    return bad
+
+
+def _not_in_set(df: pd.DataFrame, column: str, valid: frozenset[str]) -> np.ndarray:
+    """
+    Mask of values outside `valid` (missing values count as invalid).
+
+    Categorical columns are checked once per category and broadcast through
+    the codes, so the cost no longer depends on the string length per row.
+    """
+    col = df[column]
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        # Code -1 (missing) indexes the trailing True
+        rejected = np.append(~col.cat.categories.isin(valid), True)
+        return rejected[col.cat.codes.to_numpy()]
+    return ~_text(df, column).isin(valid).to_numpy(dtype=bool)
+
+
+def _invalid_row_mask(df: pd.DataFrame) -> np.ndarray:
+    """
+    Boolean mask of rows that break at least one AmazonOrder rule.
 
-def _safe(val):
-    """Convert pandas NaN / None to Python None; everything else to str."""
-    if val is None:
-        return None
-    if isinstance(val, float) and math.isnan(val):
-        return None
-    return val
+    Every rule is OR-ed in place into one preallocated mask, so no extra
+    per-rule result arrays are kept around.
+    """
+    mask = np.zeros(len(df), dtype=np.bool_)
+    mask |= (_text(df, "Order ID").str.strip() == "").to_numpy(dtype=bool)
+    mask |= _bad_date_format(_text(df, "Date"))
+    mask |= _not_in_set(df, "Status", VALID_STATUSES)
+    mask |= _not_in_set(df, "Fulfilment", VALID_FULFILMENT)
+    mask |= _not_in_set(df, "currency", VALID_CURRENCIES)
+    mask |= _not_in_set(df, "ship-country", VALID_COUNTRIES)
+    qty = _numeric(df, "Qty")
+    mask |= ~(qty >= 0)  # also flags missing / non-numeric Qty
+    mask |= qty % 1 != 0  # fractional Qty is not a valid int
+    amount = _numeric(df, "Amount")
+    mask |= amount < 0
+    mask |= np.isnan(amount) & df["Amount"].notna().to_numpy(dtype=bool)  # non-numeric
+    return mask
+
+
+def _nullable(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column values as-is, with missing values as None."""
+    col = df[column]
+    return col.astype(object).where(col.notna(), None)
+
+
+def _to_records(df: pd.DataFrame) -> list[dict]:
+    """Convert DataFrame rows into AmazonOrder input dicts."""
+    return pd.DataFrame(
+        {
+            "order_id": _text(df, "Order ID"),
+            "date": _text(df, "Date"),
+            "status": _text(df, "Status"),
+            "fulfilment": _text(df, "Fulfilment"),
+            "currency": _text(df, "currency"),
+            "qty": _nullable(df, "Qty"),
+            "amount": _nullable(df, "Amount"),
+            "ship_country": _text(df, "ship-country"),
+        }
+    ).to_dict("records")
 
 
 # ── Main Function ────────────────────────────────────────────────────────────
 
-def run_pydantic_validation(df: pd.DataFrame) -> dict:
+def run_pydantic_validation(df: pd.DataFrame, run_ts: str | None = None) -> dict:
     """
     Validate every row in the DataFrame against the AmazonOrder model.
 
+    Args:
+        df: pandas DataFrame to validate
+        run_ts: ISO timestamp of the pipeline run (defaults to now)
+
     Returns:
         dict: {
             total_rows, valid_rows, invalid_rows,
@@ -151,28 +243,23 @@ def run_pydantic_validation(df: pd.DataFrame) -> dict:
 
     errors: list[dict] = []
 
-    for idx, row in df.iterrows():
-        try:
-            AmazonOrder(
-                order_id=str(_safe(row.get("Order ID")) or ""),
-                date=str(_safe(row.get("Date")) or ""),
-                status=str(_safe(row.get("Status")) or ""),
-                fulfilment=str(_safe(row.get("Fulfilment")) or ""),
-                currency=str(_safe(row.get("currency")) or ""),
-                qty=int(row.get("Qty", 0)),
-                amount=_safe(row.get("Amount")),
-                ship_country=str(_safe(row.get("ship-country")) or ""),
+    # Only rows flagged by the column masks need a model round-trip
+    bad_rows = df.iloc[np.flatnonzero(_invalid_row_mask(df))]
+
+    try:
+        _ORDERS_ADAPTER.validate_python(_to_records(bad_rows))
+    except ValidationError as e:
+        for err in e.errors():
+            # loc = (position in bad_rows, field name)
+            pos, *field = err["loc"]
+            errors.append(
+                {
+                    "row": int(bad_rows.index[pos]) + 2,  # +2: header row + 0-based index
+                    "field": field[-1] if field else "unknown",
+                    "message": err["msg"],
+                    "value": str(err.get("input", "")),
+                }
             )
-        except ValidationError as e:
-            for err in e.errors():
-                errors.append(
-                    {
-                        "row": int(idx) + 2,  # +2: header row + 0-based index
-                        "field": err["loc"][-1] if err["loc"] else "unknown",
-                        "message": err["msg"],
-                        "value": str(err.get("input", "")),
-                    }
-                )
 
     total = len(df)
     invalid_rows = len({e["row"] for e in errors})
@@ -185,7 +272,7 @@ def run_pydantic_validation(df: pd.DataFrame) -> dict:
         "error_count": len(errors),
         "errors": errors,
         "overall_success": len(errors) == 0,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": run_ts or datetime.now().isoformat(),
     }
 
     # Console output
@@ -206,3 +293,25 @@ def run_pydantic_validation(df: pd.DataFrame) -> dict:
             print(f"   Row {e['row']:>6} | {e['field']:<15} | {e['message']}")
 
     return summary
+
+
+# ── Chunk Merging ────────────────────────────────────────────────────────────
+
+def merge_pydantic_summaries(summaries: list[dict]) -> dict:
+    """Combine per-chunk Pydantic summaries into one summary for the whole dataset."""
+    if len(summaries) == 1:
+        return summaries[0]
+
+    errors = [e for s in summaries for e in s["errors"]]
+    total = sum(s["total_rows"] for s in summaries)
+    invalid_rows = sum(s["invalid_rows"] for s in summaries)
+
+    return {
+        "total_rows": total,
+        "valid_rows": total - invalid_rows,
+        "invalid_rows": invalid_rows,
+        "error_count": len(errors),
+        "errors": errors,
+        "overall_success": len(errors) == 0,
+        "timestamp": summaries[0]["timestamp"] if summaries else datetime.now().isoformat(),
+    }
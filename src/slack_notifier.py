@@ -5,17 +5,192 @@ Sends GE and Pydantic validation results to Slack as a Block Kit message.
 
 Usage:
     send_slack_notification(ge_summary, pydantic_summary, webhook_url)
+
+    # Several datasets → one consolidated message
+    notifier = SlackNotifier(webhook_url, flush_interval=2.0)
+    notifier.submit(ge_summary, pydantic_summary, dataset_name="Amazon Sales")
+
+The POST runs on a background thread over a shared keep-alive session, so the
+pipeline is not blocked on Slack; pending sends are flushed at interpreter exit.
 """
 
-import json
-import requests
+import atexit
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# orjson is optional: faster C serializer, falls back to the stdlib
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    import json
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# ── Shared HTTP session + sender thread ──────────────────────────────────────
+
+# Keep-alive pool for hooks.slack.com; retries are not done by urllib3
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0)
+)
+_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="slack")
+atexit.register(_EXECUTOR.shutdown, wait=True)
+
+# ── Timeouts ─────────────────────────────────────────────────────────────────
+
+CONNECT_TIMEOUT = 2.0  # seconds; fail fast on unreachable / black-holed hosts
+READ_TIMEOUT = 10.0  # seconds; allow slow responses once connected
+
+# ── Retry policy ─────────────────────────────────────────────────────────────
+
+MAX_RETRIES = 3  # retries after the first attempt
+BASE_DELAY = 0.5  # seconds; doubled per attempt, ±25% jitter
+MAX_DELAY = 10.0  # cap for both backoff and Retry-After
+RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+# ── Circuit breaker (per webhook URL) ────────────────────────────────────────
+
+CB_THRESHOLD = 5  # consecutive failed attempts before the circuit opens
+CB_COOLDOWN = 60.0  # seconds to short-circuit before a half-open probe
+_BREAKERS: dict[str, dict] = {}
+_BREAKERS_LOCK = threading.Lock()  # sender threads update breakers concurrently
+
+
+# ── Message limits ───────────────────────────────────────────────────────────
+
+GE_SAMPLE = 10  # failed expectations listed in the message
+PY_SAMPLE = 5  # Pydantic errors listed in the message
+SECTION_TEXT_LIMIT = 2900  # Slack rejects section text over 3000 chars
+MAX_BLOCKS = 50  # Slack rejects messages with more blocks
+MAX_PAYLOAD_BYTES = 40_000  # Slack's payload size cap
+_ENVELOPE_BYTES = 200  # attachment wrapper + "more blocks truncated" note
+_TRUNCATED = "… (truncated)"
+
+# Minute-resolution timestamp shown in the message, reused within the minute
+_TS_CACHE = {"minute": -1, "s": ""}
+
+
+DEFAULT_DATASET = "Amazon Sales"
+
+# ── Static Block Kit fragments (shared, never mutated) ───────────────────────
+
+_HEADER_TEXT = {"type": "plain_text", "emoji": True}
+_DIVIDER = {"type": "divider"}
+_GE_TITLE_FIELD = {"type": "mrkdwn", "text": "*Great Expectations*"}
+_PY_TITLE_FIELD = {"type": "mrkdwn", "text": "*Pydantic Validation*"}
+
+
+# ── Notifier ─────────────────────────────────────────────────────────────────
+
+class SlackNotifier:
+    """
+    Buffers validation reports for one webhook and posts them as one message.
+
+    Reports submitted within `flush_interval` seconds of the first buffered
+    one are combined into a single Block Kit message. With flush_interval=0
+    every report is sent on its own, straight away.
+    """
+
+    def __init__(self, webhook_url: str, flush_interval: float = 2.0):
+        self.webhook_url = webhook_url
+        self.flush_interval = flush_interval
+        self._pending: list[tuple[str, dict, dict]] = []
+        self._on_delivered: list[Callable[[], None]] = []
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+
+    def submit(
+        self,
+        ge_summary: dict,
+        pydantic_summary: dict,
+        dataset_name: str = DEFAULT_DATASET,
+        on_delivered: Callable[[], None] | None = None,
+    ) -> None:
+        """
+        Buffer one dataset's results; the flush is scheduled on the first one.
+
+        `on_delivered` is called (on the sender thread) once Slack accepted
+        the message this report went out in.
+        """
+        if not _url_configured(self.webhook_url):
+            logger.warning("Slack notification skipped (no webhook URL configured)")
+            return
+
+        with self._lock:
+            self._pending.append((dataset_name, ge_summary, pydantic_summary))
+            if on_delivered is not None:
+                self._on_delivered.append(on_delivered)
+            if self.flush_interval > 0 and self._timer is None:
+                # Non-daemon, so a pending flush still runs at interpreter exit
+                self._timer = threading.Timer(
+                    self.flush_interval, self._flush, kwargs={"on_timer": True}
+                )
+                self._timer.start()
+
+        if self.flush_interval <= 0:
+            self._flush()
+
+    def flush(self) -> None:
+        """Send everything buffered so far without waiting for the timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+        self._flush()
+
+    def _flush(self, on_timer: bool = False) -> None:
+        with self._lock:
+            reports, self._pending = self._pending, []
+            callbacks, self._on_delivered = self._on_delivered, []
+            self._timer = None
+        if not reports:
+            return
+
+        if _breaker_open(self.webhook_url):
+            logger.warning("Slack notification skipped (circuit open after repeated failures)")
+            return
+
+        payload = _build_payload(reports)
+        if on_timer:
+            self._send(payload, callbacks)  # already off the caller's thread
+        else:
+            _EXECUTOR.submit(self._send, payload, callbacks)
+
+    def _send(self, payload: dict, callbacks: list[Callable[[], None]]) -> None:
+        if _post(self.webhook_url, payload):
+            for callback in callbacks:
+                try:
+                    callback()
+                except Exception:  # would be lost in the discarded Future
+                    logger.exception("on_delivered callback failed")
+
+
+# One immediate (flush_interval=0) notifier per webhook URL
+_NOTIFIERS: dict[str, SlackNotifier] = {}
+
 
 def send_slack_notification(
     ge_summary: dict,
     pydantic_summary: dict,
     webhook_url: str,
+    notify_on_success: bool = True,
+    on_delivered: Callable[[], None] | None = None,
 ) -> bool:
     """
     Send validation results to a Slack webhook.
@@ -24,130 +199,267 @@ def send_slack_notification(
         ge_summary: Great Expectations validation summary
         pydantic_summary: Pydantic validation summary
         webhook_url: Slack Incoming Webhook URL
+        notify_on_success: if False, nothing is sent when every check passed
+        on_delivered: called on the sender thread once Slack returned 2xx
 
     Returns:
-        True if successful, False otherwise
+        True if the notification was queued (or suppressed because all
+        checks passed), False if skipped. Queued is not delivered; use
+        `on_delivered` for anything that depends on delivery.
     """
-    if not webhook_url or webhook_url == "YOUR_SLACK_WEBHOOK_URL":
-        print("\n⚠️  Slack notification skipped (no webhook URL configured)")
+    if not _url_configured(webhook_url):
+        logger.warning("Slack notification skipped (no webhook URL configured)")
+        return False
+
+    if _report_ok(ge_summary, pydantic_summary) and not notify_on_success:
+        logger.info("All checks passed; Slack notification suppressed")
+        return True
+
+    if _breaker_open(webhook_url):
+        logger.warning("Slack notification skipped (circuit open after repeated failures)")
         return False
 
-    print("\n📤 Sending Slack notification...")
+    logger.info("Queueing Slack notification")
+
+    # Payload is built here; only the network I/O runs in the background
+    notifier = _NOTIFIERS.get(webhook_url)
+    if notifier is None:
+        notifier = _NOTIFIERS[webhook_url] = SlackNotifier(webhook_url, flush_interval=0)
+    notifier.submit(ge_summary, pydantic_summary, on_delivered=on_delivered)
+    return True
+
+
+def _url_configured(webhook_url: str) -> bool:
+    return bool(webhook_url) and webhook_url != "YOUR_SLACK_WEBHOOK_URL"
+
 
+# ── Payload ──────────────────────────────────────────────────────────────────
+
+def _report_ok(ge_summary: dict, pydantic_summary: dict) -> bool:
+    return ge_summary.get("overall_success", False) and pydantic_summary.get(
+        "overall_success", False
+    )
+
+
+def _build_payload(reports: list[tuple[str, dict, dict]]) -> dict:
+    """Build one Block Kit message for (dataset, GE, Pydantic) reports (no I/O)."""
     # ── Status ───────────────────────────────────────────────────────────
-    ge_ok = ge_summary.get("overall_success", False)
-    py_ok = pydantic_summary.get("overall_success", False)
-    all_ok = ge_ok and py_ok
+    all_ok = all(_report_ok(ge, py) for _, ge, py in reports)
 
     emoji = "✅" if all_ok else "❌"
     color = "#36a64f" if all_ok else "#dc3545"
     status_text = "ALL PASSED" if all_ok else "ISSUES FOUND"
 
-    # ── GE Failed Details ────────────────────────────────────────────────
-    ge_failed_text = ""
-    if ge_summary.get("failed"):
-        ge_failed_text = "\n".join(
-            f"• *{f['expectation']}* (`{f['column']}`)"
-            for f in ge_summary["failed"]
-        )
-
-    # ── Pydantic Error Details ───────────────────────────────────────────
-    py_error_text = ""
-    py_errors = pydantic_summary.get("errors", [])
-    if py_errors:
-        sample = py_errors[:5]
-        py_error_text = "\n".join(
-            f"• Row {e['row']}: *{e['field']}* — {e['message']}"
-            for e in sample
-        )
-        if len(py_errors) > 5:
-            py_error_text += f"\n_… and {len(py_errors) - 5} more errors_"
+    names = ", ".join(name for name, _, _ in reports)
+    label = "Dataset" if len(reports) == 1 else "Datasets"
 
     # ── Slack Message (Block Kit) ────────────────────────────────────────
     blocks = [
         {
             "type": "header",
             "text": {
-                "type": "plain_text",
+                **_HEADER_TEXT,
                 "text": f"{emoji} Data Quality Report — {status_text}",
-                "emoji": True,
             },
         },
-        {
-            "type": "section",
-            "fields": [
-                {"type": "mrkdwn", "text": "*Dataset:*\nAmazon Sales"},
-                {"type": "mrkdwn", "text": f"*Timestamp:*\n{datetime.now().strftime('%Y-%m-%d %H:%M')}"},
-            ],
-        },
-        {"type": "divider"},
-        # GE Summary
-        {
-            "type": "section",
-            "fields": [
-                {"type": "mrkdwn", "text": "*Great Expectations*"},
-                {
-                    "type": "mrkdwn",
-                    "text": (
-                        f"{'✅' if ge_ok else '❌'} "
-                        f"{ge_summary.get('passed_count', 0)} passed / "
-                        f"{ge_summary.get('failed_count', 0)} failed"
-                    ),
-                },
-            ],
-        },
+        _fields_section(
+            _mrkdwn(f"*{label}:*\n{names}"),
+            _mrkdwn(f"*Timestamp:*\n{_ts()}"),
+        ),
+    ]
+
+    for name, ge_summary, pydantic_summary in reports:
+        blocks.append(_DIVIDER)
+        if len(reports) > 1:
+            blocks.append(_text_section(f"*{name}*"))
+        blocks.extend(_report_blocks(ge_summary, pydantic_summary))
+
+    return {"attachments": [{"color": color, "blocks": _enforce_limits(blocks)}]}
+
+
+def _report_blocks(ge_summary: dict, pydantic_summary: dict) -> list[dict]:
+    """GE + Pydantic summary (and detail) sections for one dataset."""
+    ge_ok = ge_summary.get("overall_success", False)
+    py_ok = pydantic_summary.get("overall_success", False)
+
+    # ── GE Failed Details ────────────────────────────────────────────────
+    ge_failed = ge_summary.get("failed") or []
+    ge_failed_text = "\n".join(
+        [f"• *{f['expectation']}* (`{f['column']}`)" for f in ge_failed[:GE_SAMPLE]]
+    )
+    if len(ge_failed) > GE_SAMPLE:
+        ge_failed_text += f"\n_… and {len(ge_failed) - GE_SAMPLE} more_"
+
+    # ── Pydantic Error Details ───────────────────────────────────────────
+    py_errors = pydantic_summary.get("errors") or []
+    py_error_text = "\n".join(
+        [f"• Row {e['row']}: *{e['field']}* — {e['message']}" for e in py_errors[:PY_SAMPLE]]
+    )
+    if len(py_errors) > PY_SAMPLE:
+        py_error_text += f"\n_… and {len(py_errors) - PY_SAMPLE} more errors_"
+
+    ge_failed_text = _truncate(ge_failed_text)
+    py_error_text = _truncate(py_error_text)
+
+    # GE Summary
+    blocks = [
+        _fields_section(
+            _GE_TITLE_FIELD,
+            _mrkdwn(
+                f"{'✅' if ge_ok else '❌'} "
+                f"{ge_summary.get('passed_count', 0)} passed / "
+                f"{ge_summary.get('failed_count', 0)} failed"
+            ),
+        ),
     ]
 
     if ge_failed_text:
-        blocks.append(
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*GE Failed Expectations:*\n{ge_failed_text}"},
-            }
-        )
+        blocks.append(_text_section(f"*GE Failed Expectations:*\n{ge_failed_text}"))
 
     # Pydantic Summary
     blocks.append(
-        {
-            "type": "section",
-            "fields": [
-                {"type": "mrkdwn", "text": "*Pydantic Validation*"},
-                {
-                    "type": "mrkdwn",
-                    "text": (
-                        f"{'✅' if py_ok else '❌'} "
-                        f"{pydantic_summary.get('valid_rows', 0)} valid / "
-                        f"{pydantic_summary.get('invalid_rows', 0)} invalid rows"
-                    ),
-                },
-            ],
-        }
+        _fields_section(
+            _PY_TITLE_FIELD,
+            _mrkdwn(
+                f"{'✅' if py_ok else '❌'} "
+                f"{pydantic_summary.get('valid_rows', 0)} valid / "
+                f"{pydantic_summary.get('invalid_rows', 0)} invalid rows"
+            ),
+        )
     )
 
     if py_error_text:
-        blocks.append(
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*Pydantic Errors (sample):*\n{py_error_text}"},
-            }
-        )
+        blocks.append(_text_section(f"*Pydantic Errors (sample):*\n{py_error_text}"))
 
-    payload = {"attachments": [{"color": color, "blocks": blocks}]}
+    return blocks
 
-    # ── Send ─────────────────────────────────────────────────────────────
-    try:
-        resp = requests.post(
-            webhook_url,
-            data=json.dumps(payload),
-            headers={"Content-Type": "application/json"},
-            timeout=10,
-        )
-        if resp.status_code == 200:
-            print("   ✅ Slack notification sent successfully!")
-            return True
+
+def _enforce_limits(blocks: list[dict]) -> list[dict]:
+    """
+    Keep the message within Slack's limits so it is never rejected with a 400
+    (which would not be retried anyway): section text is cut to
+    SECTION_TEXT_LIMIT, and trailing blocks are dropped until at most
+    MAX_BLOCKS remain and the serialized payload fits MAX_PAYLOAD_BYTES.
+    """
+    for i, block in enumerate(blocks):
+        text = block.get("text", {}).get("text", "")
+        if block["type"] == "section" and len(text) > SECTION_TEXT_LIMIT:
+            blocks[i] = _text_section(_truncate(text))
+
+    budget = MAX_PAYLOAD_BYTES - _ENVELOPE_BYTES
+    sizes = [len(_dumps(block)) + 1 for block in blocks]  # +1: separating comma
+    if len(blocks) <= MAX_BLOCKS and sum(sizes) <= budget:
+        return blocks
+
+    keep = min(len(blocks), MAX_BLOCKS - 1)  # leaves room for the note
+    while keep > 1 and sum(sizes[:keep]) > budget:
+        keep -= 1
+    return blocks[:keep] + [
+        _text_section(f"_… {len(blocks) - keep} more blocks truncated_")
+    ]
+
+
+def _ts() -> str:
+    """Current time as 'YYYY-MM-DD HH:MM', formatted at most once per minute."""
+    minute = int(time.time() // 60)
+    if _TS_CACHE["minute"] != minute:
+        _TS_CACHE["s"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+        _TS_CACHE["minute"] = minute
+    return _TS_CACHE["s"]
+
+
+def _truncate(text: str, limit: int = SECTION_TEXT_LIMIT) -> str:
+    """Cut text to at most `limit` chars, marking the cut."""
+    if len(text) <= limit:
+        return text
+    return text[: limit - len(_TRUNCATED)] + _TRUNCATED
+
+
+def _mrkdwn(text: str) -> dict:
+    return {"type": "mrkdwn", "text": text}
+
+
+def _fields_section(*fields: dict) -> dict:
+    return {"type": "section", "fields": list(fields)}
+
+
+def _text_section(text: str) -> dict:
+    return {"type": "section", "text": _mrkdwn(text)}
+
+
+def _post(webhook_url: str, payload: dict) -> bool:
+    """POST the payload to Slack, retrying transient failures; runs on the sender thread."""
+    body = _dumps(payload)  # serialized once, reused by every attempt
+    if len(body) > MAX_PAYLOAD_BYTES:
+        logger.warning("Slack payload is %d bytes (limit %d)", len(body), MAX_PAYLOAD_BYTES)
+
+    for attempt in range(MAX_RETRIES + 1):
+        retry_after = None
+        try:
+            resp = _SESSION.post(
+                webhook_url,
+                data=body,
+                headers=_JSON_HEADERS,
+                timeout=(CONNECT_TIMEOUT, READ_TIMEOUT),
+            )
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as exc:
+            logger.warning("Slack connection error: %s", exc)
+            _record_attempt(webhook_url, ok=False)
+        except Exception:
+            logger.exception("Slack connection error")
+            _record_attempt(webhook_url, ok=False)
+            return False
         else:
-            print(f"   ❌ Slack error: HTTP {resp.status_code}")
+            ok = 200 <= resp.status_code < 300
+            _record_attempt(webhook_url, ok=ok)
+            if ok:
+                logger.info("Slack notification sent")
+                return True
+            logger.warning("Slack error: HTTP %d", resp.status_code)
+            if resp.status_code not in RETRYABLE_STATUS:
+                return False
+            retry_after = resp.headers.get("Retry-After")
+
+        if _breaker_open(webhook_url):
+            logger.warning("Slack circuit open — giving up on this notification")
             return False
-    except Exception as exc:
-        print(f"   ❌ Slack connection error: {exc}")
-        return False
+        if attempt < MAX_RETRIES:
+            delay = _retry_delay(attempt, retry_after)
+            logger.info("Retrying Slack notification in %.1fs", delay)
+            time.sleep(delay)
+
+    return False
+
+
+def _retry_delay(attempt: int, retry_after: str | None) -> float:
+    """Seconds to wait before the next attempt (Retry-After wins if valid)."""
+    if retry_after is not None:
+        try:
+            return min(MAX_DELAY, max(0.0, float(int(retry_after))))
+        except ValueError:
+            pass
+    delay = min(MAX_DELAY, BASE_DELAY * 2**attempt)
+    return delay * (1 + random.uniform(-0.25, 0.25))
+
+
+def _breaker_open(webhook_url: str) -> bool:
+    """True while the URL's circuit is open (too many failures, still cooling down)."""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.get(webhook_url)
+        return (
+            breaker is not None
+            and breaker["fails"] >= CB_THRESHOLD
+            and time.monotonic() - breaker["opened_at"] < CB_COOLDOWN
+        )
+
+
+def _record_attempt(webhook_url: str, ok: bool) -> None:
+    """Update the URL's breaker; a failure at/over the threshold (re)opens it."""
+    with _BREAKERS_LOCK:
+        breaker = _BREAKERS.setdefault(webhook_url, {"fails": 0, "opened_at": 0.0})
+        if ok:
+            breaker["fails"] = 0
+            return
+        breaker["fails"] += 1
+        if breaker["fails"] >= CB_THRESHOLD:
+            breaker["opened_at"] = time.monotonic()